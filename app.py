@@ -6,6 +6,7 @@ for a cinema complex.
 """
 import os
 import sys
+import atexit
 from flask import Flask, request, Response
 from twilio.twiml.messaging_response import MessagingResponse
 from loguru import logger
@@ -16,6 +17,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Import modules
 from modules.utils import setup_logging
 from modules.bot import cinema_bot
+from modules.messaging import message_handler
 from modules.session import session_manager
 from config import settings
 
@@ -26,6 +28,15 @@ app = Flask(__name__)
 setup_logging()
 logger.info("Starting WhatsApp Cinema Bot")
 
+# Send replies from a background worker pool so the webhook can ack right away
+if settings.messaging.async_send:
+    message_handler.messaging.start_outbound_queue(
+        workers=settings.messaging.send_workers,
+        maxsize=settings.messaging.send_queue_size,
+        enqueue_timeout=settings.messaging.enqueue_timeout
+    )
+    atexit.register(message_handler.messaging.stop_outbound_queue, settings.messaging.drain_timeout)
+
 @app.route('/webhook', methods=['POST'])
 def webhook():
     """Handle incoming WhatsApp webhook"""
@@ -36,11 +47,17 @@ def webhook():
         
         logger.info(f"Received webhook from {sender}")
         
-        # Process the message
-        cinema_bot.process_incoming_message(sender, incoming_msg)
+        # Process the message, collecting replies inline in TwiML mode
+        replies = cinema_bot.process_incoming_message(
+            sender, incoming_msg, inline=settings.messaging.reply_mode == "twiml"
+        )
         
-        # Return empty TwiML response
+        # Return TwiML response with any inline replies
         resp = MessagingResponse()
+        for body, media_url in replies:
+            message = resp.message(body)
+            for url in media_url or []:
+                message.media(url)
         return str(resp)
     except Exception as e:
         logger.error(f"Error in webhook: {str(e)}")
@@ -49,7 +66,11 @@ def webhook():
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return {'status': 'ok'}
+    status = {'status': 'ok'}
+    outbound = message_handler.messaging.outbound
+    if outbound is not None:
+        status['outbound_queue'] = outbound.metrics()
+    return status
 
 @app.route('/', methods=['GET'])
 def index():
@@ -27,12 +27,40 @@ class CinemaSettings(BaseSettings):
     class Config:
         env_file = '.env'
 
+class MessagingSettings(BaseSettings):
+    """Outbound messaging configuration settings"""
+    reply_mode: str = Field("rest", env="REPLY_MODE")
+    async_send: bool = Field(False, env="ASYNC_SEND")
+    send_workers: int = Field(4, env="SEND_WORKERS")
+    send_queue_size: int = Field(1000, env="SEND_QUEUE_SIZE")
+    enqueue_timeout: float = Field(0.5, env="SEND_ENQUEUE_TIMEOUT")
+    drain_timeout: float = Field(10.0, env="SEND_DRAIN_TIMEOUT")
+    broadcast_rate: float = Field(10.0, env="BROADCAST_RATE")
+    broadcast_concurrency: int = Field(8, env="BROADCAST_CONCURRENCY")
+    
+    class Config:
+        env_file = '.env'
+
+class TransportSettings(BaseSettings):
+    """Twilio HTTP transport settings"""
+    pool_size: int = Field(20, env="TWILIO_POOL_SIZE")
+    connect_timeout: float = Field(3.05, env="TWILIO_CONNECT_TIMEOUT")
+    read_timeout: float = Field(10.0, env="TWILIO_READ_TIMEOUT")
+    max_retries: int = Field(3, env="TWILIO_MAX_RETRIES")
+    backoff_base: float = Field(0.5, env="TWILIO_BACKOFF_BASE")
+    backoff_max: float = Field(8.0, env="TWILIO_BACKOFF_MAX")
+    
+    class Config:
+        env_file = '.env'
+
 class Settings:
     """Main configuration container"""
     def __init__(self):
         try:
             self.twilio = TwilioSettings()
             self.cinema = CinemaSettings()
+            self.messaging = MessagingSettings()
+            self.transport = TransportSettings()
             logger.info("Configuration loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load configuration: {str(e)}")
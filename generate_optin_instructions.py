@@ -5,7 +5,6 @@ Generate opt-in instructions for WhatsApp recipients
 import os
 import sys
 from dotenv import load_dotenv
-from twilio.rest import Client
 from loguru import logger
 
 # Add the current directory to the Python path
@@ -13,12 +12,13 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import modules
 from config import settings
+from modules.transport import create_client
 
 def get_twilio_sandbox_info():
     """Get WhatsApp Sandbox information from Twilio"""
     try:
         # Initialize Twilio client
-        client = Client(settings.twilio.account_sid, settings.twilio.auth_token)
+        client = create_client()
         
         # Get sandbox information
         whatsapp_sender = settings.twilio.whatsapp_number
@@ -5,7 +5,6 @@ Send an invitation to join the Twilio WhatsApp Sandbox
 import os
 import sys
 from dotenv import load_dotenv
-from twilio.rest import Client
 from loguru import logger
 
 # Add the current directory to the Python path
@@ -13,12 +12,13 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import modules
 from config import settings
+from modules.transport import create_client
 
 def send_join_instructions(to_number, sandbox_code=None):
     """Send instructions to join the WhatsApp sandbox"""
     try:
         # Initialize Twilio client
-        client = Client(settings.twilio.account_sid, settings.twilio.auth_token)
+        client = create_client()
         
         # Format the phone number for SMS (not WhatsApp, since they can't receive WhatsApp yet)
         if to_number.startswith('whatsapp:'):
@@ -1,4 +1,5 @@
 """Main WhatsApp Cinema Bot logic"""
+from typing import List, Optional, Tuple
 from loguru import logger
 from modules.messaging import message_handler
 from modules.session import session_manager
@@ -9,10 +10,25 @@ class CinemaBot:
         self.message_handler = message_handler
         logger.info("Cinema Bot initialized and ready")
     
-    def process_incoming_message(self, sender: str, message_body: str) -> None:
-        """Process incoming WhatsApp message"""
+    def process_incoming_message(self, sender: str, message_body: str,
+                                 inline: bool = False) -> List[Tuple[str, Optional[List[str]]]]:
+        """Process incoming WhatsApp message
+        
+        With ``inline`` set, replies to the sender are not sent but returned
+        as (body, media_url) pairs for the webhook to render as TwiML.
+        """
         logger.debug(f"Received message from {sender}: {message_body}")
         
+        if not inline:
+            self._handle(sender, message_body)
+            return []
+        
+        with self.message_handler.messaging.capture_replies(sender) as replies:
+            self._handle(sender, message_body)
+        return replies
+    
+    def _handle(self, sender: str, message_body: str) -> None:
+        """Run the message handler, replying with an error message on failure"""
         try:
             # Handle the message based on session state
             self.message_handler.handle_message(sender, message_body)
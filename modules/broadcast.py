@@ -0,0 +1,194 @@
+"""Bulk broadcast of WhatsApp messages to a list of recipients"""
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+from loguru import logger
+
+# Column/field names recognised as the recipient's phone number
+PHONE_FIELDS = ("phone", "phone_number", "number", "to")
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how many sends start per second"""
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available and take it"""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                # Tolerate float rounding so a refill that lands just short of 1 counts
+                if self.tokens >= 1 - 1e-9:
+                    self.tokens = max(0.0, self.tokens - 1)
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+def iter_recipients(path) -> Iterator[str]:
+    """Stream phone numbers from a CSV or JSON-lines file"""
+    path = Path(path)
+    with open(path, "r", newline="") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            for line in f:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    yield _phone_from(record) if isinstance(record, dict) else str(record)
+            return
+        
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        fields = [h.strip().lower() for h in header]
+        column = next((fields.index(name) for name in PHONE_FIELDS if name in fields), None)
+        if column is None:
+            # No header row, the first column holds the numbers
+            column = 0
+            yield header[0].strip()
+        for row in reader:
+            if len(row) > column and row[column].strip():
+                yield row[column].strip()
+
+def _phone_from(record: Dict) -> str:
+    """Get the phone number from a JSON record"""
+    for name in PHONE_FIELDS:
+        if record.get(name):
+            return str(record[name]).strip()
+    raise ValueError(f"No phone number in record: {record}")
+
+class Broadcaster:
+    """Sends one message to many recipients with bounded concurrency
+    
+    Every outcome is appended to a JSON-lines results file together with the
+    recipient's index in the input. A checkpoint file next to it records how
+    many leading recipients are finished, so an interrupted run resumes where
+    it stopped without messaging anyone twice.
+    """
+    def __init__(self, send: Callable[[str, str], str], body: str, results_path,
+                 concurrency: int = 8, rate: float = 10.0, checkpoint_every: int = 50):
+        self.send = send
+        self.body = body
+        self.results_path = Path(results_path)
+        self.checkpoint_path = self.results_path.with_name(self.results_path.name + ".checkpoint")
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate)
+        self.checkpoint_every = checkpoint_every
+        self.counts = {"sent": 0, "not_subscribed": 0, "error": 0, "skipped": 0}
+        self._lock = threading.Lock()
+        self._watermark = 0
+        self._finished: Set[int] = set()
+        self._since_checkpoint = 0
+    
+    def _load_progress(self) -> Tuple[int, Set[int]]:
+        """Read the checkpoint and the indexes finished after it"""
+        offset = 0
+        if self.checkpoint_path.exists():
+            with open(self.checkpoint_path, "r") as f:
+                offset = json.load(f).get("offset", 0)
+        
+        done = set()
+        if self.results_path.exists():
+            with open(self.results_path, "r") as f:
+                for line in f:
+                    try:
+                        index = json.loads(line)["index"]
+                    except (ValueError, KeyError):
+                        continue
+                    if index >= offset:
+                        done.add(index)
+        return offset, done
+    
+    def _save_checkpoint(self) -> None:
+        """Atomically write the contiguous finished offset"""
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"offset": self._watermark}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+    
+    def _finish(self, index: int, result: Dict, results_file) -> None:
+        """Record an outcome and advance the checkpoint"""
+        with self._lock:
+            if result is None:
+                self.counts["skipped"] += 1
+            else:
+                results_file.write(json.dumps(result) + "\n")
+                results_file.flush()
+                self.counts[result["status"]] += 1
+            self._finished.add(index)
+            while self._watermark in self._finished:
+                self._finished.remove(self._watermark)
+                self._watermark += 1
+            self._since_checkpoint += 1
+            if self._since_checkpoint >= self.checkpoint_every:
+                self._save_checkpoint()
+                self._since_checkpoint = 0
+    
+    def _deliver(self, index: int, to: str) -> Dict:
+        """Send to one recipient and describe the outcome"""
+        result = {"index": index, "to": to}
+        try:
+            result.update(status="sent", sid=self.send(to, self.body))
+        except Exception as e:
+            status = "not_subscribed" if "is not currently subscribed" in str(e) else "error"
+            result.update(status=status, error=str(e))
+        return result
+    
+    def run(self, recipients: Iterator[str], resume: bool = True) -> Dict[str, int]:
+        """Send to every recipient and return outcome counts"""
+        offset, done = self._load_progress() if resume else (0, set())
+        if not resume:
+            self.results_path.unlink(missing_ok=True)
+        if offset or done:
+            logger.info(f"Resuming broadcast after {offset} recipients ({len(done)} more already done)")
+        self._watermark = offset
+        
+        # Bound the number of submitted-but-unfinished sends so memory stays flat
+        in_flight = threading.Semaphore(self.concurrency * 2)
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(self.results_path, "a") as results_file, \
+                ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            def work(index: int, to: str) -> None:
+                try:
+                    self._finish(index, self._deliver(index, to), results_file)
+                finally:
+                    in_flight.release()
+            
+            try:
+                for index, to in enumerate(recipients):
+                    if index < offset:
+                        continue
+                    if index in done:
+                        self._finish(index, None, results_file)
+                        continue
+                    in_flight.acquire()
+                    self.bucket.acquire()
+                    executor.submit(work, index, to)
+            except KeyboardInterrupt:
+                logger.warning("Broadcast interrupted, waiting for in-flight sends")
+                raise
+            finally:
+                executor.shutdown(wait=True)
+                with self._lock:
+                    self._save_checkpoint()
+        
+        logger.info(f"Broadcast finished: {self.counts}")
+        return dict(self.counts)
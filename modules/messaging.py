@@ -1,34 +1,201 @@
 """WhatsApp messaging handler module"""
-from typing import Dict, List, Any, Optional
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from loguru import logger
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 from config import settings
+from modules.transport import get_http_client
 from modules.session import BookingState, session_manager
 
+# Sentinel telling an outbound worker thread to exit
+_STOP = object()
+
+class OutboundQueue:
+    """Bounded queue delivering outbound messages from a pool of worker threads
+    
+    Messages are sharded by recipient so each worker owns its own queue and
+    replies to the same user are always delivered in the order they were sent.
+    When a shard stays full for longer than ``enqueue_timeout`` the caller
+    delivers the message itself, which throttles producers instead of
+    dropping replies.
+    """
+    def __init__(self, deliver: Callable[[str, str, Optional[List[str]]], bool],
+                 workers: int = 4, maxsize: int = 1000, enqueue_timeout: float = 0.5):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.deliver = deliver
+        self.enqueue_timeout = enqueue_timeout
+        shard_size = max(1, maxsize // workers)
+        self.capacity = shard_size * workers
+        self._shards = [queue.Queue(maxsize=shard_size) for _ in range(workers)]
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {"enqueued": 0, "sent": 0, "failed": 0, "overflow": 0}
+    
+    def start(self) -> None:
+        """Start the worker threads"""
+        for index, shard in enumerate(self._shards):
+            thread = threading.Thread(
+                target=self._worker, args=(shard,),
+                name=f"outbound-sender-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Outbound queue started with {len(self._shards)} workers")
+    
+    def submit(self, to: str, body: str, media_url: Optional[List[str]] = None) -> bool:
+        """Queue a message for delivery, delivering inline when the queue is full"""
+        if self._closed:
+            return self.deliver(to, body, media_url)
+        
+        shard = self._shards[hash(to) % len(self._shards)]
+        try:
+            shard.put((to, body, media_url), timeout=self.enqueue_timeout)
+        except queue.Full:
+            logger.warning(f"Outbound queue full, sending to {to} inline")
+            self._count("overflow")
+            return self.deliver(to, body, media_url)
+        
+        self._count("enqueued")
+        return True
+    
+    def _worker(self, shard: queue.Queue) -> None:
+        """Deliver queued messages until told to stop"""
+        while True:
+            item = shard.get()
+            try:
+                if item is _STOP:
+                    return
+                sent = self.deliver(*item)
+                self._count("sent" if sent else "failed")
+            except Exception as e:
+                logger.error(f"Outbound worker error: {str(e)}")
+                self._count("failed")
+            finally:
+                shard.task_done()
+    
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+    
+    @property
+    def depth(self) -> int:
+        """Number of messages waiting to be delivered"""
+        return sum(shard.qsize() for shard in self._shards)
+    
+    def metrics(self) -> Dict[str, int]:
+        """Snapshot of queue depth and delivery counters"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(depth=self.depth, capacity=self.capacity, workers=len(self._shards))
+        return stats
+    
+    def shutdown(self, timeout: float = 10.0) -> bool:
+        """Stop accepting work and drain queued messages
+        
+        Returns True if every worker finished within the timeout.
+        """
+        self._closed = True
+        deadline = time.monotonic() + timeout
+        pending = self.depth
+        if pending:
+            logger.info(f"Draining {pending} queued outbound messages")
+        
+        for shard in self._shards:
+            try:
+                shard.put(_STOP, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                pass
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        
+        drained = not any(thread.is_alive() for thread in self._threads)
+        if drained:
+            logger.info("Outbound queue drained")
+        else:
+            logger.warning(f"Outbound queue shutdown timed out with {self.depth} messages pending")
+        return drained
+
 class WhatsAppMessaging:
     """WhatsApp messaging handler using Twilio"""
     def __init__(self):
         """Initialize with Twilio client"""
         try:
-            self.client = Client(settings.twilio.account_sid, settings.twilio.auth_token)
+            self.client = Client(settings.twilio.account_sid, settings.twilio.auth_token,
+                                 http_client=get_http_client())
             self.whatsapp_number = settings.twilio.whatsapp_number
+            self.outbound: Optional[OutboundQueue] = None
+            self._capture = threading.local()
             logger.info("WhatsApp messaging client initialized")
         except Exception as e:
             logger.error(f"Failed to initialize WhatsApp messaging: {str(e)}")
             raise
     
+    def start_outbound_queue(self, workers: int = 4, maxsize: int = 1000,
+                             enqueue_timeout: float = 0.5) -> OutboundQueue:
+        """Send messages from a background worker pool instead of the caller's thread"""
+        if self.outbound is None:
+            self.outbound = OutboundQueue(self.deliver, workers, maxsize, enqueue_timeout)
+            self.outbound.start()
+        return self.outbound
+    
+    def stop_outbound_queue(self, timeout: float = 10.0) -> bool:
+        """Drain the outbound queue and go back to sending synchronously"""
+        if self.outbound is None:
+            return True
+        outbound, self.outbound = self.outbound, None
+        return outbound.shutdown(timeout)
+    
+    @staticmethod
+    def format_number(to: str) -> str:
+        """Normalize a phone number to the whatsapp:+<number> form"""
+        if not to.startswith('whatsapp:'):
+            return f'whatsapp:{to}'
+        # Ensure no space after whatsapp:
+        prefix, number = to.split(':', 1)
+        return f'{prefix}:{number.strip()}'
+    
+    @contextmanager
+    def capture_replies(self, to: str) -> Iterator[List[Tuple[str, Optional[List[str]]]]]:
+        """Collect messages sent to ``to`` on this thread instead of sending them
+        
+        The collected (body, media_url) pairs are meant to be returned inline
+        in the TwiML webhook response. Messages to any other number are still
+        sent through the REST API.
+        """
+        replies: List[Tuple[str, Optional[List[str]]]] = []
+        previous = getattr(self._capture, 'target', None)
+        self._capture.target = (self.format_number(to), replies)
+        try:
+            yield replies
+        finally:
+            self._capture.target = previous
+    
     def send_message(self, to: str, body: str, media_url: Optional[List[str]] = None) -> bool:
-        """Send WhatsApp message with optional media"""
+        """Send WhatsApp message with optional media
+        
+        When the outbound queue is running the message is queued and True
+        means it was accepted for delivery.
+        """
+        to = self.format_number(to)
+        
+        target = getattr(self._capture, 'target', None)
+        if target is not None and target[0] == to:
+            target[1].append((body, media_url))
+            return True
+        
+        if self.outbound is not None:
+            return self.outbound.submit(to, body, media_url)
+        return self.deliver(to, body, media_url)
+    
+    def deliver(self, to: str, body: str, media_url: Optional[List[str]] = None) -> bool:
+        """Send a message through the Twilio REST API"""
         try:
-            # Clean up the phone number format
-            if not to.startswith('whatsapp:'):
-                to = f'whatsapp:{to}'
-            else:
-                # Ensure no space after whatsapp:
-                prefix, number = to.split(':', 1)
-                to = f'{prefix}:{number.strip()}'
-            
             message = self.client.messages.create(
                 from_=self.whatsapp_number,
                 body=body,
@@ -0,0 +1,97 @@
+"""Shared, pooled HTTP transport for the Twilio REST client"""
+import random
+import threading
+import time
+from typing import Optional
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectTimeout
+from twilio.http.http_client import TwilioHttpClient
+from twilio.rest import Client
+from config import settings
+
+# Status codes where Twilio did not process the request and a retry is safe
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class PooledHttpClient(TwilioHttpClient):
+    """Twilio HTTP client with a keep-alive connection pool, timeouts and retries
+    
+    Retries 429 and 5xx responses, plus connections that never got
+    established, with capped exponential backoff and full jitter. A
+    Retry-After header from Twilio takes precedence over the backoff.
+    """
+    def __init__(self, pool_size: int = 20, connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 8.0):
+        super().__init__(pool_connections=True)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=0, pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+    
+    def request(self, method, url, params=None, data=None, headers=None, auth=None, timeout=None,
+                allow_redirects=False):
+        """Make an HTTP request, retrying throttled and failed attempts"""
+        attempt = 0
+        while True:
+            try:
+                response = super().request(method, url, params=params, data=data, headers=headers,
+                                           auth=auth, timeout=timeout, allow_redirects=allow_redirects)
+            except ConnectTimeout:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"Twilio connect timeout, retrying in {delay:.2f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                delay = self._retry_after(response) or self._backoff(attempt)
+                logger.warning(f"Twilio returned {response.status_code}, retrying in {delay:.2f}s")
+            
+            time.sleep(delay)
+            attempt += 1
+    
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for the given attempt"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def _retry_after(self, response) -> Optional[float]:
+        """Delay requested by a Retry-After header, capped at backoff_max"""
+        value = (response.headers or {}).get('Retry-After')
+        try:
+            return min(self.backoff_max, max(0.0, float(value)))
+        except (TypeError, ValueError):
+            return None
+
+_http_client: Optional[PooledHttpClient] = None
+_http_client_lock = threading.Lock()
+
+def get_http_client() -> PooledHttpClient:
+    """Get the process-wide pooled HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                transport = settings.transport
+                _http_client = PooledHttpClient(
+                    pool_size=transport.pool_size,
+                    connect_timeout=transport.connect_timeout,
+                    read_timeout=transport.read_timeout,
+                    max_retries=transport.max_retries,
+                    backoff_base=transport.backoff_base,
+                    backoff_max=transport.backoff_max
+                )
+                logger.info(f"Twilio HTTP transport initialized (pool size {transport.pool_size})")
+    return _http_client
+
+def create_client(account_sid: Optional[str] = None, auth_token: Optional[str] = None) -> Client:
+    """Create a Twilio client that shares the pooled HTTP transport"""
+    return Client(
+        account_sid or settings.twilio.account_sid,
+        auth_token or settings.twilio.auth_token,
+        http_client=get_http_client()
+    )
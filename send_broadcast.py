@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Broadcast a WhatsApp message to a list of recipients
+"""
+import os
+import sys
+import argparse
+from loguru import logger
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Import modules
+from config import settings
+from modules.broadcast import Broadcaster, iter_recipients
+from modules.transport import create_client
+from send_whatsapp_invitation import INVITATION_MESSAGE
+
+def main():
+    """Parse arguments and run the broadcast"""
+    parser = argparse.ArgumentParser(description="Broadcast a WhatsApp message to many recipients")
+    parser.add_argument("recipients", help="CSV or JSON-lines file of phone numbers")
+    parser.add_argument("--message", help="Message body (defaults to the #WRETRO invitation)")
+    parser.add_argument("--message-file", help="Read the message body from a file")
+    parser.add_argument("--results", default="data/broadcast_results.jsonl",
+                        help="JSON-lines file for per-recipient outcomes")
+    parser.add_argument("--concurrency", type=int, default=settings.messaging.broadcast_concurrency,
+                        help="Number of sends in flight at once")
+    parser.add_argument("--rate", type=float, default=settings.messaging.broadcast_rate,
+                        help="Maximum messages started per second")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore previous progress and start from the first recipient")
+    args = parser.parse_args()
+    
+    body = args.message or INVITATION_MESSAGE
+    if args.message_file:
+        with open(args.message_file, "r") as f:
+            body = f.read()
+    
+    client = create_client()
+    
+    def send(to, message_body):
+        if not to.startswith('whatsapp:'):
+            to = f'whatsapp:{to}'
+        return client.messages.create(
+            from_=settings.twilio.whatsapp_number,
+            body=message_body,
+            to=to
+        ).sid
+    
+    broadcaster = Broadcaster(send, body, args.results,
+                              concurrency=args.concurrency, rate=args.rate)
+    try:
+        counts = broadcaster.run(iter_recipients(args.recipients), resume=not args.restart)
+    except KeyboardInterrupt:
+        print("\n⏸  Broadcast stopped. Run the same command again to resume.")
+        sys.exit(130)
+    
+    print(f"✅ Sent: {counts['sent']}")
+    print(f"❌ Not subscribed: {counts['not_subscribed']}")
+    print(f"❌ Errors: {counts['error']}")
+    if counts['skipped']:
+        print(f"↩  Already done in a previous run: {counts['skipped']}")
+    print(f"Results written to {args.results}")
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,6 @@ Test script to send a WhatsApp message using Twilio
 import os
 import sys
 from dotenv import load_dotenv
-from twilio.rest import Client
 from loguru import logger
 
 # Add the current directory to the Python path
@@ -14,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Import modules
 from modules.utils import setup_logging
 from config import settings
+from modules.transport import create_client
 
 # Setup logging
 setup_logging()
@@ -26,7 +26,7 @@ def send_test_message(to_number: str, message: str = "Welcome to Sri Sakthi Cine
             to_number = f'whatsapp:{to_number}'
             
         # Initialize Twilio client
-        client = Client(settings.twilio.account_sid, settings.twilio.auth_token)
+        client = create_client()
         
         # Log attempt
         logger.info(f"Sending test message to {to_number}")
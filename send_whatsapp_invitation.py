@@ -5,7 +5,6 @@ Send WhatsApp invitation with opt-in instructions
 import os
 import sys
 from dotenv import load_dotenv
-from twilio.rest import Client
 from loguru import logger
 
 # Add the current directory to the Python path
@@ -13,12 +12,18 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import modules
 from config import settings
+from modules.transport import create_client
+
+INVITATION_MESSAGE = (
+    "Welcome to Sri Sakthi Cinemas WhatsApp Bot! 🎬\n\n"
+    "To book tickets for our Women's FDFS-RETRO show, just send #WRETRO"
+)
 
 def send_whatsapp_invitation(to_number, sandbox_code="most-bean"):
     """Send WhatsApp invitation to join the bot service"""
     try:
         # Initialize Twilio client
-        client = Client(settings.twilio.account_sid, settings.twilio.auth_token)
+        client = create_client()
         
         # Ensure the recipient is already a valid WhatsApp recipient
         # This only works if they've already joined your sandbox
@@ -29,10 +34,7 @@ def send_whatsapp_invitation(to_number, sandbox_code="most-bean"):
         whatsapp_sender = settings.twilio.whatsapp_number
         
         # Craft the invitation message
-        message_body = (
-            "Welcome to Sri Sakthi Cinemas WhatsApp Bot! 🎬\n\n"
-            "To book tickets for our Women's FDFS-RETRO show, just send #WRETRO"
-        )
+        message_body = INVITATION_MESSAGE
         
         # Check if recipient is already registered, if yes, send direct welcome
         # If not, the message will fail, and we need to ask them to join the sandbox
@@ -0,0 +1,133 @@
+"""Tests for the bulk broadcast engine"""
+import unittest
+import json
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.broadcast import Broadcaster, TokenBucket, iter_recipients
+
+class FakeClock:
+    """Manually advanced clock for the token bucket"""
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the token bucket rate limiter"""
+    
+    def test_limits_rate(self):
+        """Test acquiring beyond the burst waits for refill"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=5, capacity=5, clock=clock, sleep=clock.sleep)
+        
+        for _ in range(15):
+            bucket.acquire()
+        
+        # 5 tokens up front, then 10 more at 5 per second
+        self.assertAlmostEqual(clock.now, 2.0)
+
+class TestIterRecipients(unittest.TestCase):
+    """Test streaming recipients from files"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_csv_with_header(self):
+        """Test reading the phone column of a CSV file"""
+        path = self.dir / "list.csv"
+        path.write_text("name,phone\nA,+911\nB,+912\n")
+        self.assertEqual(list(iter_recipients(path)), ["+911", "+912"])
+    
+    def test_csv_without_header(self):
+        """Test reading a bare list of numbers"""
+        path = self.dir / "list.csv"
+        path.write_text("+911\n+912\n")
+        self.assertEqual(list(iter_recipients(path)), ["+911", "+912"])
+    
+    def test_jsonl(self):
+        """Test reading JSON-lines records"""
+        path = self.dir / "list.jsonl"
+        path.write_text('{"phone": "+911"}\n\n{"to": "+912"}\n')
+        self.assertEqual(list(iter_recipients(path)), ["+911", "+912"])
+
+class TestBroadcaster(unittest.TestCase):
+    """Test sending, outcome recording and resuming"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.results = Path(self.tmp.name) / "results.jsonl"
+        self.sent = []
+        self.lock = threading.Lock()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def send(self, to, body):
+        if to == "+bad":
+            raise Exception("Twilio could not find a Channel with the specified From address")
+        if to == "+new":
+            raise Exception("The recipient is not currently subscribed to your sandbox")
+        with self.lock:
+            self.sent.append(to)
+        return f"SM{to}"
+    
+    def read_results(self):
+        with open(self.results) as f:
+            return [json.loads(line) for line in f]
+    
+    def test_records_outcomes(self):
+        """Test every recipient gets an outcome row"""
+        broadcaster = Broadcaster(self.send, "hi", self.results, concurrency=4, rate=1000)
+        counts = broadcaster.run(iter(["+1", "+bad", "+new", "+2"]))
+        
+        self.assertEqual(counts["sent"], 2)
+        self.assertEqual(counts["error"], 1)
+        self.assertEqual(counts["not_subscribed"], 1)
+        by_index = {row["index"]: row for row in self.read_results()}
+        self.assertEqual(by_index[0]["sid"], "SM+1")
+        self.assertEqual(by_index[2]["status"], "not_subscribed")
+        checkpoint = json.loads(Path(str(self.results) + ".checkpoint").read_text())
+        self.assertEqual(checkpoint["offset"], 4)
+    
+    def test_resume_skips_finished_recipients(self):
+        """Test a second run only sends to recipients not yet done"""
+        # A previous run finished the first recipient and, out of order, the third
+        Path(str(self.results) + ".checkpoint").write_text('{"offset": 1}')
+        self.results.write_text('{"index": 0, "to": "+1", "status": "sent", "sid": "SM+1"}\n'
+                                '{"index": 2, "to": "+3", "status": "sent", "sid": "SM+3"}\n')
+        
+        broadcaster = Broadcaster(self.send, "hi", self.results, concurrency=2, rate=1000)
+        counts = broadcaster.run(iter(["+1", "+2", "+3", "+4"]))
+        
+        self.assertEqual(sorted(self.sent), ["+2", "+4"])
+        self.assertEqual(counts["skipped"], 1)
+        self.assertEqual(len(self.read_results()), 4)
+    
+    def test_restart_ignores_progress(self):
+        """Test resume=False sends to everyone again"""
+        Path(str(self.results) + ".checkpoint").write_text('{"offset": 2}')
+        
+        broadcaster = Broadcaster(self.send, "hi", self.results, concurrency=2, rate=1000)
+        broadcaster.run(iter(["+1", "+2"]), resume=False)
+        
+        self.assertEqual(sorted(self.sent), ["+1", "+2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,12 @@ import unittest
 from unittest.mock import patch, MagicMock
 import sys
 import os
+import threading
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from modules.messaging import WhatsAppMessaging, MessageHandler
+from modules.messaging import WhatsAppMessaging, MessageHandler, OutboundQueue
 from modules.session import BookingState, UserSession
 
 class TestWhatsAppMessaging(unittest.TestCase):
@@ -44,6 +45,90 @@ class TestWhatsAppMessaging(unittest.TestCase):
         # Assert
         self.assertFalse(result)
 
+    @patch('modules.messaging.Client')
+    def test_send_message_queued(self, mock_client):
+        """Test sending through the outbound queue"""
+        # Setup
+        mock_messages = MagicMock()
+        mock_client.return_value.messages = mock_messages
+        mock_messages.create.return_value = MagicMock(sid='TEST_SID')
+        
+        # Execute
+        messaging = WhatsAppMessaging()
+        messaging.start_outbound_queue(workers=2, maxsize=10)
+        result = messaging.send_message('+1234567890', 'Test message')
+        drained = messaging.stop_outbound_queue(timeout=5)
+        
+        # Assert
+        self.assertTrue(result)
+        self.assertTrue(drained)
+        self.assertIsNone(messaging.outbound)
+        mock_messages.create.assert_called_once()
+        self.assertEqual(mock_messages.create.call_args.kwargs['to'], 'whatsapp:+1234567890')
+
+    @patch('modules.messaging.Client')
+    def test_capture_replies(self, mock_client):
+        """Test replies to the captured sender are collected instead of sent"""
+        # Setup
+        mock_messages = MagicMock()
+        mock_client.return_value.messages = mock_messages
+        mock_messages.create.return_value = MagicMock(sid='TEST_SID')
+        
+        # Execute
+        messaging = WhatsAppMessaging()
+        with messaging.capture_replies('whatsapp: +1234567890') as replies:
+            messaging.send_message('whatsapp:+1234567890', 'Inline reply')
+            messaging.send_message('+1999', 'Out-of-band message')
+        messaging.send_message('+1234567890', 'After capture')
+        
+        # Assert
+        self.assertEqual(replies, [('Inline reply', None)])
+        sent_to = [call.kwargs['to'] for call in mock_messages.create.call_args_list]
+        self.assertEqual(sent_to, ['whatsapp:+1999', 'whatsapp:+1234567890'])
+
+class TestOutboundQueue(unittest.TestCase):
+    """Test the outbound send queue"""
+    
+    def test_preserves_order_per_recipient(self):
+        """Test messages to one recipient are delivered in order"""
+        delivered = []
+        outbound = OutboundQueue(lambda to, body, media: delivered.append((to, body)) or True,
+                                 workers=4, maxsize=100)
+        outbound.start()
+        for i in range(20):
+            outbound.submit('whatsapp:+1', str(i))
+        self.assertTrue(outbound.shutdown(timeout=5))
+        
+        self.assertEqual([body for _, body in delivered], [str(i) for i in range(20)])
+        self.assertEqual(outbound.metrics()['sent'], 20)
+        self.assertEqual(outbound.metrics()['depth'], 0)
+    
+    def test_full_queue_delivers_inline(self):
+        """Test backpressure falls back to delivering on the caller's thread"""
+        started = threading.Event()
+        release = threading.Event()
+        callers = []
+        
+        def deliver(to, body, media):
+            callers.append(threading.current_thread().name)
+            if body == 'block':
+                started.set()
+                release.wait(5)
+            return True
+        
+        outbound = OutboundQueue(deliver, workers=1, maxsize=1, enqueue_timeout=0.01)
+        outbound.start()
+        outbound.submit('whatsapp:+1', 'block')
+        started.wait(5)
+        outbound.submit('whatsapp:+1', 'queued')
+        outbound.submit('whatsapp:+1', 'overflow')
+        release.set()
+        outbound.shutdown(timeout=5)
+        
+        self.assertEqual(outbound.metrics()['overflow'], 1)
+        self.assertIn(threading.current_thread().name, callers)
+        self.assertEqual(len(callers), 3)
+
 class TestMessageHandler(unittest.TestCase):
     """Test message handling functionality"""
     
@@ -0,0 +1,93 @@
+"""Tests for the pooled Twilio HTTP transport"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from requests.exceptions import ConnectTimeout
+from modules.transport import PooledHttpClient, get_http_client, create_client
+
+def make_response(status, headers=None):
+    """Build a fake requests response"""
+    response = MagicMock()
+    response.status_code = status
+    response.text = '{}'
+    response.headers = headers or {}
+    return response
+
+class TestPooledHttpClient(unittest.TestCase):
+    """Test retry and timeout behaviour of the pooled HTTP client"""
+    
+    def setUp(self):
+        self.client = PooledHttpClient(pool_size=5, connect_timeout=1, read_timeout=2,
+                                       max_retries=2, backoff_base=0.1, backoff_max=1)
+        self.client.session.send = MagicMock()
+    
+    @patch('modules.transport.time.sleep')
+    def test_retries_server_errors(self, mock_sleep):
+        """Test 5xx responses are retried until success"""
+        self.client.session.send.side_effect = [make_response(503), make_response(201)]
+        
+        response = self.client.request('POST', 'https://api.twilio.com/Messages.json')
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.client.session.send.call_count, 2)
+        self.assertEqual(self.client.session.send.call_args.kwargs['timeout'], (1, 2))
+        mock_sleep.assert_called_once()
+        self.assertLessEqual(mock_sleep.call_args.args[0], 0.1)
+    
+    @patch('modules.transport.time.sleep')
+    def test_honours_retry_after(self, mock_sleep):
+        """Test 429 responses wait for the Retry-After delay"""
+        self.client.session.send.side_effect = [make_response(429, {'Retry-After': '0.75'}),
+                                                make_response(201)]
+        
+        self.client.request('POST', 'https://api.twilio.com/Messages.json')
+        
+        mock_sleep.assert_called_once_with(0.75)
+    
+    @patch('modules.transport.time.sleep')
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        """Test the last failed response is returned once retries run out"""
+        self.client.session.send.return_value = make_response(500)
+        
+        response = self.client.request('POST', 'https://api.twilio.com/Messages.json')
+        
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.client.session.send.call_count, 3)
+    
+    @patch('modules.transport.time.sleep')
+    def test_does_not_retry_client_errors(self, mock_sleep):
+        """Test 4xx responses other than 429 are returned immediately"""
+        self.client.session.send.return_value = make_response(400)
+        
+        response = self.client.request('POST', 'https://api.twilio.com/Messages.json')
+        
+        self.assertEqual(response.status_code, 400)
+        mock_sleep.assert_not_called()
+    
+    @patch('modules.transport.time.sleep')
+    def test_retries_connect_timeout(self, mock_sleep):
+        """Test connections that never opened are retried"""
+        self.client.session.send.side_effect = [ConnectTimeout(), make_response(201)]
+        
+        response = self.client.request('POST', 'https://api.twilio.com/Messages.json')
+        
+        self.assertEqual(response.status_code, 201)
+
+class TestTransportFactory(unittest.TestCase):
+    """Test the shared transport factory"""
+    
+    def test_clients_share_transport(self):
+        """Test every client created by the factory uses one HTTP client"""
+        first = create_client()
+        second = create_client()
+        
+        self.assertIs(first.http_client, get_http_client())
+        self.assertIs(second.http_client, first.http_client)
+
+if __name__ == '__main__':
+    unittest.main()